@@ -6,6 +6,9 @@ Contains game constants, screen dimensions, colors, etc.
 class Config:
     """Class containing game configuration constants"""
     
+    # Debug settings
+    DEBUG = False  # Draw debug markers (e.g. the rod position)
+    
     # Screen settings
     SCREEN_WIDTH = 800
     SCREEN_HEIGHT = 600
@@ -18,6 +21,7 @@ class Config:
     TEXT_SHADOW_COLOR = (0, 0, 0)
     BUTTON_COLOR = (50, 50, 200)
     BUTTON_HOVER_COLOR = (70, 70, 220)
+    BUTTON_DISABLED_COLOR = (100, 100, 100)  # Upgrades the player can't afford
     BUTTON_TEXT_COLOR = (255, 255, 255)
     LINE_COLOR = (50, 50, 50)
     
@@ -27,6 +31,7 @@ class Config:
     BASE_REEL_SPEED = 5  # pixels per frame
     BASE_HOOK_CAPACITY = 4  # number of fish
     BASE_MAX_DEPTH = 300  # pixels
+    LINE_CURVE_THRESHOLD = 10  # horizontal offset (pixels) above which the line is drawn curved
     
     # Upgrade settings
     UPGRADE_COSTS = {
@@ -40,14 +45,24 @@ class Config:
     CAPACITY_INCREASE_PER_LEVEL = 1  # fish
     TIMER_INCREASE_PER_LEVEL = 5000  # milliseconds (5 seconds)
     
-    # Depth zones (in pixels from top of water)
-    DEPTH_ZONES = {
-        "surface": (0, 100),
-        "shallows": (101, 200),
-        "mid_water": (201, 300),
-        "deep_sea": (301, 400),
-        "abyss": (401, 500)
-    }
+    # Depth zones as (name, min depth, max depth), in order from the top of the
+    # water (in pixels)
+    DEPTH_ZONE_TABLE = (
+        ("surface", 0, 100),
+        ("shallows", 101, 200),
+        ("mid_water", 201, 300),
+        ("deep_sea", 301, 400),
+        ("abyss", 401, 500)
+    )
+    
+    # Depth zones keyed by name, built from the table above
+    DEPTH_ZONES = {name: (min_depth, max_depth) for name, min_depth, max_depth in DEPTH_ZONE_TABLE}
+    
+    # Zone order derived once from DEPTH_ZONES
+    DEPTH_ZONE_NAMES = tuple(DEPTH_ZONES.keys())
+    
+    # Number of pre-rendered blend steps between adjacent zone backgrounds
+    BACKGROUND_BLEND_STEPS = 8
     
     # Asset paths
     ASSET_PATH = "assets/"
@@ -74,5 +89,8 @@ class Config:
     BUTTON_HEIGHT = 50
     BUTTON_RADIUS = 10  # For rounded corners
     
+    # Sound settings
+    SFX_CHANNELS = 16  # Mixer channels reserved for sound effects
+    
     # Save file
     SAVE_FILE = "saves/game_save.json"
@@ -5,8 +5,51 @@ Handles fish sprites, behavior, and the fish manager
 import pygame
 import os
 import random
+import bisect
+import functools
+from typing import NamedTuple
 from config import Config
 
+@functools.lru_cache(maxsize=None)
+def _load_fish_image(image_path):
+    """Load a fish image once per path; later calls return the same Surface"""
+    # Requires the display mode to be set (for convert_alpha)
+    full_path = os.path.join(Config.SPRITE_PATH, image_path)
+    try:
+        if os.path.exists(full_path):
+            return pygame.image.load(full_path).convert_alpha()
+        else:
+            # Missing images all share a single placeholder
+            return _fish_placeholder()
+    except pygame.error:
+        # Create a placeholder on error
+        placeholder = pygame.Surface((40, 20))
+        placeholder.fill((0, 0, 255))
+        return placeholder.convert_alpha()
+        
+@functools.lru_cache(maxsize=None)
+def _fish_placeholder():
+    """Create the placeholder image used for missing fish sprites"""
+    placeholder = pygame.Surface((40, 20))
+    placeholder.fill((0, 0, 255))  # Blue for fish
+    # Add eye
+    pygame.draw.circle(placeholder, (255, 255, 255), (30, 10), 5)
+    pygame.draw.circle(placeholder, (0, 0, 0), (30, 10), 2)
+    # Match the pixel format of loaded sprites for fast blits
+    return placeholder.convert_alpha()
+
+# Shared registry of (normal, flipped) Surfaces keyed by fish name. Every fish
+# of a species references the same pair instead of owning its own copy.
+FISH_SURFACES = {}
+
+class FishSpec(NamedTuple):
+    """Static data describing a fish species"""
+    name: str
+    image: str
+    rarity: str
+    value: int
+    depth_range: str
+
 class Fish(pygame.sprite.Sprite):
     """Class for individual fish sprites"""
     
@@ -14,72 +57,104 @@ class Fish(pygame.sprite.Sprite):
         super().__init__()
         
         # Fish properties from data
-        self.name = fish_data["name"]
-        self.rarity = fish_data["rarity"]
-        self.value = fish_data["value"]
-        self.depth_range = fish_data["depth_range"]
-        
-        # Load image
-        self.image = self.load_image(fish_data["image"])
+        self.name = fish_data.name
+        self.rarity = fish_data.rarity
+        self.value = fish_data.value
+        self.depth_range = fish_data.depth_range
+        
+        # Look up the images shared by every fish of this species
+        self._surfaces = self.get_surfaces(fish_data)
+        self.image = self._surfaces[0]
         self.rect = self.image.get_rect()
         
         # Position and movement
         self.direction = random.choice([-1, 1])  # -1 for left, 1 for right
         self.speed = random.uniform(Config.MIN_FISH_SPEED, Config.MAX_FISH_SPEED)
         
+        # Per-frame velocity never changes, so work it out once
+        self.velocity_x = self.direction * self.speed
+        self.rise_speed = self.speed * 0.5  # Move upward at half the horizontal speed
+        
         # Set initial position based on depth zone
         self.rect.y = random.randint(depth_zone[0], depth_zone[1])
         
         # Start from edge of screen based on direction
+        # The bounds rect is the area the fish must overlap to stay alive: it ends
+        # just past the edge the fish swims towards, and vertically allows the
+        # fish's top to range from 100 pixels above the screen to the screen bottom
+        width, height = self.rect.size
+        bounds_top = height - 101
+        bounds_height = Config.SCREEN_HEIGHT + 102 - height
         if self.direction == -1:  # Moving left
-            self.rect.x = Config.SCREEN_WIDTH + self.rect.width
+            self.rect.x = Config.SCREEN_WIDTH + width
+            self.bounds = pygame.Rect(-1, bounds_top, Config.SCREEN_WIDTH + 2 * width + 2, bounds_height)
         else:  # Moving right
-            self.rect.x = -self.rect.width
+            self.rect.x = -width
+            self.bounds = pygame.Rect(-2 * width, bounds_top, Config.SCREEN_WIDTH + 2 * width + 1, bounds_height)
+            
+        # Sub-pixel position (the rect only holds whole pixels, so small
+        # per-frame movements would otherwise be lost to rounding)
+        self.x_pos = float(self.rect.x)
+        self.y_pos = float(self.rect.y)
             
         # State
         self.caught = False
         
         # Original depth zone for reference
-        self.original_zone = fish_data["depth_range"]
-        
-    def load_image(self, image_path):
-        """Load fish image with error handling and placeholder fallback"""
-        full_path = os.path.join(Config.SPRITE_PATH, image_path)
-        try:
-            if os.path.exists(full_path):
-                return pygame.image.load(full_path).convert_alpha()
-            else:
-                # Create a placeholder fish image
-                placeholder = pygame.Surface((40, 20))
-                placeholder.fill((0, 0, 255))  # Blue for fish
-                # Add eye
-                pygame.draw.circle(placeholder, (255, 255, 255), (30, 10), 5)
-                pygame.draw.circle(placeholder, (0, 0, 0), (30, 10), 2)
-                return placeholder
-        except pygame.error:
-            # Create a placeholder on error
-            placeholder = pygame.Surface((40, 20))
-            placeholder.fill((0, 0, 255))
-            return placeholder
+        self.original_zone = fish_data.depth_range
+        
+    @staticmethod
+    def load_image(image_path):
+        """Load fish image with error handling and placeholder fallback (cached per path)"""
+        return _load_fish_image(image_path)
+        
+    @staticmethod
+    def get_surfaces(fish_data):
+        """Get the shared (normal, flipped) Surfaces for a fish species"""
+        surfaces = FISH_SURFACES.get(fish_data.name)
+        if surfaces is None:
+            image = Fish.load_image(fish_data.image)
+            surfaces = (image, pygame.transform.flip(image, True, False))
+            FISH_SURFACES[fish_data.name] = surfaces
+        return surfaces
             
-    def update(self):
-        """Update fish position and check if it's off-screen"""
+    def update(self, camera_shift=0):
+        """Update fish position, returning False once it has gone off-screen"""
         if not self.caught:
             # Move fish horizontally
-            self.rect.x += self.direction * self.speed
+            x = self.x_pos + self.velocity_x
             
             # Always move fish upward
-            self.rect.y -= self.speed * 0.5  # Move upward at half the horizontal speed
+            y = self.y_pos - self.rise_speed
             
             # Add a small random variation to the upward movement
-            if random.random() < 0.2:  # 20% chance each frame
-                self.rect.y -= random.randint(0, 2)  # Can move up faster
+            # One draw decides both whether to jitter (20% chance each frame)
+            # and by how much (0-2 pixels, uniformly)
+            jitter = random.random()
+            if jitter < 0.2:
+                y -= int(jitter * 15)  # Can move up faster
+                
+            # Follow the camera: move up when going deeper, down when reeling in
+            if camera_shift:
+                y -= camera_shift
+                
+                # Add slight randomization to vertical movement for more natural feel
+                if random.random() < 0.1:  # 10% chance
+                    y += random.uniform(-2, 2)
+                    
+            # Store the sub-pixel position and write the rect once
+            self.x_pos = x
+            self.y_pos = y
+            rect = self.rect
+            rect.x = round(x)
+            rect.y = round(y)
             
-            # Check if fish is off-screen
-            if (self.direction == -1 and self.rect.right < 0) or \
-               (self.direction == 1 and self.rect.left > Config.SCREEN_WIDTH) or \
-               self.rect.top > Config.SCREEN_HEIGHT:  # Off bottom of screen
-                self.kill()  # Remove from sprite group
+            # Check if fish is off-screen (past its exit edge, or too far above
+            # or below the screen)
+            # The fish manager removes off-screen fish from its group in one batch
+            if not self.bounds.colliderect(rect):
+                return False
+        return True
                 
     def catch(self):
         """Mark fish as caught"""
@@ -88,18 +163,19 @@ class Fish(pygame.sprite.Sprite):
             return True
         return False
         
-    def draw_on_hook(self, surface, position):
-        """Draw the fish when caught on the hook"""
-        # Create a copy of the image for rotation if needed
-        fish_image = self.image.copy()
-        
+    def get_hook_blit(self, position):
+        """Get the (image, top-left) pair for drawing the fish on the hook"""
         # For caught fish, we might want to rotate them to hang vertically
-        if self.direction == -1:
-            fish_image = pygame.transform.flip(fish_image, True, False)
+        # Flipped variant is pre-built, so no Surface is allocated per draw
+        fish_image = self._surfaces[1 if self.direction == -1 else 0]
             
-        # Draw fish at the specified position
-        fish_rect = fish_image.get_rect(center=position)
-        surface.blit(fish_image, fish_rect)
+        # Center the fish at the specified position
+        width, height = fish_image.get_size()
+        return fish_image, (position[0] - width // 2, position[1] - height // 2)
+        
+    def draw_on_hook(self, surface, position):
+        """Draw the fish when caught on the hook"""
+        surface.blit(*self.get_hook_blit(position))
         
     def get_value(self):
         """Get the coin value of the fish"""
@@ -129,84 +205,82 @@ class FishManager:
         # Fish data
         self.fish_data = self.initialize_fish_data()
         
+        # Fish data grouped by depth zone (depth ranges never change at runtime)
+        self.fish_by_zone = {}
+        for fish in self.fish_data:
+            self.fish_by_zone.setdefault(fish.depth_range, []).append(fish)
+        
+        # Warm the shared Surface registry so the first spawn of each species doesn't stall on disk I/O
+        for fish in self.fish_data:
+            Fish.get_surfaces(fish)
+        
+        # Each zone followed by the zones directly above and below it
+        zones = Config.DEPTH_ZONE_NAMES
+        self.zone_neighbors = {
+            zone: (zone,) + zones[max(0, i - 1):i] + zones[i + 1:i + 2]
+            for i, zone in enumerate(zones)
+        }
+        
+        # Max depth of each zone in order, for binary searching the current zone
+        self.zone_max_depths = [max_depth for _, _, max_depth in Config.DEPTH_ZONE_TABLE]
+        
+        # Screen-space spawn range for each zone (static, so computed once)
+        self.spawn_ranges = self.build_spawn_ranges()
+        
         # Background images for different depth zones
         self.background_images = self.load_background_images()
         
+        # Pre-blended backgrounds for zone transitions
+        self.blended_backgrounds = self.build_blended_backgrounds()
+        
         # Spawn timer
-        self.last_spawn_time = 0
         self.spawn_interval = 1000  # milliseconds
+        self.next_spawn_time = self.spawn_interval  # Absolute time of the next spawn
         
         # Camera tracking variables
         self.previous_depth = 0  # To track depth changes
         self.camera_offset_y = 0  # Vertical camera offset
         
     def initialize_fish_data(self):
-        """Initialize fish data with names, rarities, values, and depth ranges"""
-        return [
-            {
-                "name": "Clownfish",
-                "image": "fish/clownfish.png",
-                "rarity": "Common",
-                "value": 10,
-                "depth_range": "surface"
-            },
-            {
-                "name": "Blue Tang",
-                "image": "fish/blue_tang.png",
-                "rarity": "Common",
-                "value": 15,
-                "depth_range": "surface"
-            },
-            {
-                "name": "Yellowtail",
-                "image": "fish/yellowtail.png",
-                "rarity": "Uncommon",
-                "value": 25,
-                "depth_range": "shallows"
-            },
-            {
-                "name": "Grouper",
-                "image": "fish/grouper.png",
-                "rarity": "Uncommon",
-                "value": 35,
-                "depth_range": "shallows"
-            },
-            {
-                "name": "Tuna",
-                "image": "fish/tuna.png",
-                "rarity": "Rare",
-                "value": 50,
-                "depth_range": "mid_water"
-            },
-            {
-                "name": "Swordfish",
-                "image": "fish/swordfish.png",
-                "rarity": "Rare",
-                "value": 75,
-                "depth_range": "mid_water"
-            },
-            {
-                "name": "Angler",
-                "image": "fish/angler.png",
-                "rarity": "Epic",
-                "value": 100,
-                "depth_range": "deep_sea"
-            },
-            {
-                "name": "Oarfish",
-                "image": "fish/oarfish.png",
-                "rarity": "Epic",
-                "value": 150,
-                "depth_range": "deep_sea"
-            },
-            {
-                "name": "Kraken",
-                "image": "fish/kraken.png",
-                "rarity": "Legendary",
-                "value": 300,
-                "depth_range": "abyss"
-            }
-        ]
+        """Initialize fish species data with names, images, rarities, values, and depth ranges"""
+        return (
+            FishSpec("Clownfish", "fish/clownfish.png", "Common", 10, "surface"),
+            FishSpec("Blue Tang", "fish/blue_tang.png", "Common", 15, "surface"),
+            FishSpec("Yellowtail", "fish/yellowtail.png", "Uncommon", 25, "shallows"),
+            FishSpec("Grouper", "fish/grouper.png", "Uncommon", 35, "shallows"),
+            FishSpec("Tuna", "fish/tuna.png", "Rare", 50, "mid_water"),
+            FishSpec("Swordfish", "fish/swordfish.png", "Rare", 75, "mid_water"),
+            FishSpec("Angler", "fish/angler.png", "Epic", 100, "deep_sea"),
+            FishSpec("Oarfish", "fish/oarfish.png", "Epic", 150, "deep_sea"),
+            FishSpec("Kraken", "fish/kraken.png", "Legendary", 300, "abyss"),
+        )
+        
+    def build_spawn_ranges(self):
+        """Work out the vertical screen range fish from each zone spawn in"""
+        spawn_ranges = {}
+        
+        # Always spawn fish near the bottom of the screen regardless of depth
+        # This ensures players can always catch fish even at maximum depth
+        screen_height = Config.SCREEN_HEIGHT
+        zone_count = len(Config.DEPTH_ZONE_NAMES)
+        
+        for zone_index, zone in enumerate(Config.DEPTH_ZONE_NAMES):
+            # Set spawn range to be at the bottom portion of the screen
+            # The range is from 3/4 of the screen height to just below the screen
+            spawn_min_y = screen_height * 0.75  # Bottom quarter of the screen
+            spawn_max_y = screen_height + 50    # Just below the visible screen
+            
+            # Add a small variation based on zone depth to maintain some depth feeling
+            # Deeper zone fish will spawn slightly higher than surface fish
+            if zone_count > 1:
+                # Small adjustment based on zone (max 50 pixels difference between zones)
+                zone_offset = (zone_index / (zone_count - 1)) * 50
+                spawn_min_y -= zone_offset
+                spawn_max_y -= zone_offset
+                
+            spawn_ranges[zone] = (int(spawn_min_y), int(spawn_max_y))
+            
+        return spawn_ranges
         
     def load_background_images(self):
         """Load background images for different depth zones"""
@@ -236,63 +310,88 @@ class FishManager:
                     elif zone == "abyss":
                         bg.fill((3, 11, 42))  # Very dark blue
                         
-                    backgrounds[zone] = bg
+                    # Match the display format so blits take the fast path
+                    backgrounds[zone] = bg.convert()
             except pygame.error:
                 # Create placeholder on error
                 bg = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
                 bg.fill((0, 0, 100))  # Default blue
-                backgrounds[zone] = bg
+                backgrounds[zone] = bg.convert()
                 
         return backgrounds
         
+    def build_blended_backgrounds(self):
+        """Pre-render blended backgrounds for each pair of adjacent depth zones"""
+        blended = {}
+        steps = Config.BACKGROUND_BLEND_STEPS
+        zones = Config.DEPTH_ZONE_NAMES
+        
+        for zone, next_zone in zip(zones, zones[1:]):
+            # Overlay is copied once per pair, not once per frame
+            overlay = self.background_images[next_zone].copy()
+            
+            # Step k blends in the next zone at alpha k/steps (k = 1..steps)
+            ladder = []
+            for k in range(1, steps + 1):
+                bg = self.background_images[zone].copy()
+                overlay.set_alpha(int(255 * k / steps))
+                bg.blit(overlay, (0, 0))
+                ladder.append(bg)
+                
+            blended[(zone, next_zone)] = ladder
+            
+        return blended
+        
     def update(self, hook_rect, current_depth=0):
         """Update all fish and check for collisions with hook"""
         # Calculate depth change since last update
         depth_change = current_depth - self.previous_depth
         self.previous_depth = current_depth
         
-        # Move all fish vertically based on depth change (camera tracking)
-        if depth_change != 0:
-            # Apply a multiplier to make the movement more pronounced
-            # This creates a stronger visual effect of descending/ascending
-            movement_multiplier = 3.0  # Increased from 1.5 to make fish move up faster
-            effective_depth_change = depth_change * movement_multiplier
-            
-            for fish in self.all_fish.sprites():
-                if not fish.caught:
-                    # Move fish up when going deeper, down when reeling in
-                    fish.rect.y -= effective_depth_change
-                    
-                    # Add slight randomization to vertical movement for more natural feel
-                    if random.random() < 0.1:  # 10% chance
-                        fish.rect.y += random.uniform(-2, 2)
-            
-            # Update camera offset
-            self.camera_offset_y += depth_change
-        
-        # Dynamically adjust spawn rate based on depth
-        # Deeper = more frequent spawns to maintain fish density
-        base_spawn_interval = 1000  # Base interval in milliseconds
-        depth_factor = min(1.0, current_depth / 500)  # Cap at 500 depth
-        self.spawn_interval = base_spawn_interval * (1.0 - (depth_factor * 0.5))  # Up to 50% faster at max depth
-        
         # Spawn new fish if it's time
         current_time = pygame.time.get_ticks()
-        if current_time - self.last_spawn_time > self.spawn_interval:
-            self.last_spawn_time = current_time
+        if current_time > self.next_spawn_time:
             self.spawn_fish(current_depth)
             
             # Occasionally spawn an extra fish at deeper depths
             if current_depth > 200 and random.random() < 0.3:  # 30% chance when deeper than 200
                 self.spawn_fish(current_depth)
+                
+            # Dynamically adjust spawn rate based on depth
+            # Deeper = more frequent spawns to maintain fish density
+            # Only needed when scheduling the next spawn, not every frame
+            base_spawn_interval = 1000  # Base interval in milliseconds
+            depth_factor = min(1.0, current_depth / 500)  # Cap at 500 depth
+            self.spawn_interval = base_spawn_interval * (1.0 - (depth_factor * 0.5))  # Up to 50% faster at max depth
+            self.next_spawn_time = current_time + self.spawn_interval
             
-        # Update all fish horizontal movement
-        self.all_fish.update()
+        # Apply a multiplier to make the camera movement more pronounced
+        # This creates a stronger visual effect of descending/ascending
+        movement_multiplier = 3.0  # Increased from 1.5 to make fish move up faster
+        effective_depth_change = depth_change * movement_multiplier
+        
+        # Fish that left the screen this frame, removed together at the end
+        off_screen = []
         
-        # Remove fish that are too far off-screen vertically
+        # Move each fish along with the camera and collect those that went
+        # off-screen, in a single pass over the live fish
         for fish in self.all_fish.sprites():
-            if not fish.caught and (fish.rect.y < -100 or fish.rect.y > Config.SCREEN_HEIGHT + 100):
-                fish.kill()
+            if not fish.caught and not fish.update(effective_depth_change):
+                off_screen.append(fish)
+                
+        # Remove all off-screen fish with a single group mutation
+        if off_screen:
+            self.all_fish.remove(*off_screen)
+                
+        # Update camera offset
+        self.camera_offset_y += depth_change
+        
+    def get_zone_index(self, depth):
+        """Get the index of the depth zone containing the given depth"""
+        # Zones are sorted by depth, so binary search their max depths
+        # Depths past the last zone are clamped to it
+        index = bisect.bisect_left(self.zone_max_depths, depth)
+        return min(index, len(self.zone_max_depths) - 1)
         
     def spawn_fish(self, current_depth=0):
         """Spawn a new fish based on current depth and unlocked zones"""
@@ -304,30 +403,15 @@ class FishManager:
             return  # No zones unlocked (shouldn't happen)
             
         # Determine which zone we're in based on current depth
-        current_zone = "surface"  # Default
-        for zone, (min_depth, max_depth) in Config.DEPTH_ZONES.items():
-            if min_depth <= current_depth <= max_depth:
-                current_zone = zone
-                break
+        current_zone = Config.DEPTH_ZONE_NAMES[self.get_zone_index(current_depth)]
                 
         # Make sure current_zone is in unlocked_zones, otherwise default to first unlocked zone
         if current_zone not in unlocked_zones and unlocked_zones:
             current_zone = unlocked_zones[0]
                 
-        # Only spawn fish from the current zone or adjacent zones
-        available_zones = []
-        if current_zone in unlocked_zones:
-            available_zones.append(current_zone)
-            
-        zone_list = list(Config.DEPTH_ZONES.keys())
-        if current_zone in zone_list:
-            current_index = zone_list.index(current_zone)
-            
-            # Add adjacent zones if they exist and are unlocked
-            if current_index > 0 and zone_list[current_index-1] in unlocked_zones:
-                available_zones.append(zone_list[current_index-1])  # Zone above
-            if current_index < len(zone_list)-1 and zone_list[current_index+1] in unlocked_zones:
-                available_zones.append(zone_list[current_index+1])  # Zone below
+        # Only spawn fish from the current zone or adjacent zones that are unlocked
+        neighbors = self.zone_neighbors.get(current_zone, (current_zone,))
+        available_zones = [zone for zone in neighbors if zone in unlocked_zones]
         
         # If no available zones after filtering, just use all unlocked zones
         if not available_zones:
@@ -336,17 +420,16 @@ class FishManager:
         # Choose a random zone from available zones
         zone_name = random.choice(available_zones)
         
-        # Get the depth range for this zone
-        zone_depth = Config.DEPTH_ZONES.get(zone_name)
-        if not zone_depth:
+        # Make sure this is a known zone
+        if zone_name not in self.spawn_ranges:
             return  # Invalid zone (shouldn't happen)
             
         # If we're in the abyss (depth > 500), allow all fish types to spawn
         if current_depth > 500:
             valid_fish = self.fish_data  # Use all fish types
         else:
-            # Filter fish that can spawn in this zone
-            valid_fish = [fish for fish in self.fish_data if fish["depth_range"] == zone_name]
+            # Fish that can spawn in this zone
+            valid_fish = self.fish_by_zone.get(zone_name)
         
         if not valid_fish:
             return  # No fish for this zone (shouldn't happen)
@@ -355,38 +438,8 @@ class FishManager:
         # For now, just choose randomly
         fish_data = random.choice(valid_fish)
         
-        # Determine spawn position based on zone and current depth
-        # Get the actual zone depth range from Config
-        zone_min_depth, zone_max_depth = Config.DEPTH_ZONES[zone_name]
-        
-        # Calculate where in the zone we currently are (as a percentage)
-        zone_range = zone_max_depth - zone_min_depth
-        if zone_range > 0:
-            zone_progress = (current_depth - zone_min_depth) / zone_range
-        else:
-            zone_progress = 0
-        
-        # Always spawn fish near the bottom of the screen regardless of depth
-        # This ensures players can always catch fish even at maximum depth
-        screen_height = Config.SCREEN_HEIGHT
-        
-        # Set spawn range to be at the bottom portion of the screen
-        # The range is from 3/4 of the screen height to just below the screen
-        spawn_min_y = screen_height * 0.75  # Bottom quarter of the screen
-        spawn_max_y = screen_height + 50    # Just below the visible screen
-        
-        # Add a small variation based on zone depth to maintain some depth feeling
-        # Deeper zone fish will spawn slightly higher than surface fish
-        zone_index = list(Config.DEPTH_ZONES.keys()).index(zone_name)
-        zone_count = len(Config.DEPTH_ZONES)
-        if zone_count > 1:
-            # Small adjustment based on zone (max 50 pixels difference between zones)
-            zone_offset = (zone_index / (zone_count - 1)) * 50
-            spawn_min_y -= zone_offset
-            spawn_max_y -= zone_offset
-        
-        # Final spawn depth range
-        adjusted_depth = (int(spawn_min_y), int(spawn_max_y))
+        # Spawn range for this zone was worked out once at startup
+        adjusted_depth = self.spawn_ranges[zone_name]
         
         # Create and add the fish
         new_fish = Fish(fish_data, adjusted_depth)
@@ -396,12 +449,16 @@ class FishManager:
         """Check if mouse is hovering over any fish to catch them"""
         caught_any = False
         
-        # Get hook rect once
-        hook_rect = fishing_line.get_hook_rect()
-        hook_center = hook_rect.center
+        # Get hook center once
+        hook_x, hook_y = fishing_line.get_hook_rect().center
         
         # Define the catch area (smaller hitbox as requested)
         catch_radius = 80  # Reduced from 120 for a smaller hitbox
+        auto_catch_radius = 30  # Auto-catch when very close to hook (reduced from 50)
+        
+        # Compare squared distances so no square root is needed per fish
+        catch_r2 = catch_radius * catch_radius
+        auto_r2 = auto_catch_radius * auto_catch_radius
         
         # Check each fish
         for fish in self.all_fish.sprites():
@@ -409,17 +466,23 @@ class FishManager:
             if fish.caught:
                 continue
                 
-            # Calculate distance between fish and hook
-            fish_center = fish.rect.center
-            dx = fish_center[0] - hook_center[0]
-            dy = fish_center[1] - hook_center[1]
-            distance = (dx**2 + dy**2)**0.5
+            # Calculate offset between fish and hook
+            fish_x, fish_y = fish.rect.center
+            dx = fish_x - hook_x
+            dy = fish_y - hook_y
+            
+            # Cheap bounding-box rejection: most fish are nowhere near the hook,
+            # so skip the distance and mouse tests for them entirely
+            if dx > catch_radius or dx < -catch_radius or dy > catch_radius or dy < -catch_radius:
+                continue
+                
+            d2 = dx*dx + dy*dy
             
             # Two ways to catch a fish:
             # 1. Mouse is over fish AND fish is near hook
             # 2. Fish is very close to hook (automatic catch for better UX)
-            if ((fish.rect.collidepoint(mouse_pos) and distance <= catch_radius) or 
-                distance <= 30):  # Auto-catch when very close to hook (reduced from 50)
+            if ((fish.rect.collidepoint(mouse_pos) and d2 <= catch_r2) or 
+                d2 <= auto_r2):
                 
                 # Try to catch the fish
                 if fish.catch() and fishing_line.add_caught_fish(fish):
@@ -451,41 +514,31 @@ class FishManager:
     def draw_background(self, surface, current_depth):
         """Draw the appropriate background based on current depth with smooth transitions"""
         # Determine which zone we're in based on depth
-        current_zone = "surface"  # Default
+        # (depths past the last zone stay in the abyss)
+        zone_table = Config.DEPTH_ZONE_TABLE
+        i = self.get_zone_index(current_depth)
+        current_zone, _, max_depth = zone_table[i]
         next_zone = None
         transition_progress = 0.0
         
-        # Find current zone and check if we're near a transition point
-        zones = list(Config.DEPTH_ZONES.keys())
-        for i, (zone, (min_depth, max_depth)) in enumerate(Config.DEPTH_ZONES.items()):
-            if min_depth <= current_depth <= max_depth:
-                current_zone = zone
-                
-                # Check if we're approaching the next zone (within 20 units of boundary)
-                transition_distance = 20
-                if i < len(zones) - 1 and current_depth > max_depth - transition_distance:
-                    next_zone = zones[i + 1]
-                    # Calculate transition progress (0.0 to 1.0)
-                    transition_progress = (current_depth - (max_depth - transition_distance)) / transition_distance
-                    transition_progress = max(0.0, min(1.0, transition_progress))  # Clamp between 0 and 1
-                break
-                
-        # If depth exceeds the maximum defined depth (500), stay in abyss zone
-        if current_depth > 500:
-            current_zone = "abyss"
-            next_zone = None
-            transition_progress = 0.0
+        # Check if we're approaching the next zone (within 20 units of boundary)
+        transition_distance = 20
+        if i < len(zone_table) - 1 and current_depth > max_depth - transition_distance:
+            next_zone = zone_table[i + 1][0]
+            # Calculate transition progress (0.0 to 1.0)
+            transition_progress = (current_depth - (max_depth - transition_distance)) / transition_distance
+            transition_progress = max(0.0, min(1.0, transition_progress))  # Clamp between 0 and 1
         
         # Draw the background with smooth transition if applicable
         if current_zone in self.background_images:
-            # Draw the current zone background
-            surface.blit(self.background_images[current_zone], (0, 0))
+            background = self.background_images[current_zone]
             
-            # If we're transitioning to next zone, blend it with alpha transparency
-            if next_zone and next_zone in self.background_images and transition_progress > 0:
-                # Create a copy of the next zone background
-                next_bg = self.background_images[next_zone].copy()
-                # Set alpha based on transition progress
-                next_bg.set_alpha(int(255 * transition_progress))
-                # Overlay the next zone background directly on the main surface
-                surface.blit(next_bg, (0, 0))
+            # If we're transitioning to next zone, use the nearest pre-blended step
+            # instead (a single opaque blit rather than a per-frame alpha blend)
+            ladder = self.blended_backgrounds.get((current_zone, next_zone))
+            if ladder and transition_progress > 0:
+                step = round(transition_progress * len(ladder))
+                if step > 0:
+                    background = ladder[step - 1]
+                    
+            surface.blit(background, (0, 0))
@@ -5,11 +5,50 @@ Handles the fishing line, hook, and catching mechanics
 import pygame
 import os
 import random
+import functools
 from config import Config
 
+# Config values used every frame, bound once at import (Config isn't changed at runtime)
+_LINE_SPEED = Config.BASE_LINE_SPEED
+_REEL_SPEED = Config.BASE_REEL_SPEED
+_HOOK_FIXED_Y = Config.SCREEN_HEIGHT // 2  # Middle of the screen
+_LINE_COLOR = Config.LINE_COLOR
+_CURVE_THRESHOLD = Config.LINE_CURVE_THRESHOLD
+
+@functools.lru_cache(maxsize=None)
+def _load_line_image(image_path):
+    """Load a fishing line image once per path; later calls return the same Surface"""
+    full_path = os.path.join(Config.SPRITE_PATH, image_path)
+    try:
+        if os.path.exists(full_path):
+            return pygame.image.load(full_path).convert_alpha()
+        else:
+            # Create a placeholder image
+            placeholder = pygame.Surface((Config.HOOK_WIDTH, Config.HOOK_HEIGHT))
+            placeholder.fill((200, 200, 200))  # Gray for hook
+            pygame.draw.circle(placeholder, (150, 150, 150), 
+                              (Config.HOOK_WIDTH // 2, Config.HOOK_HEIGHT // 2), 
+                              min(Config.HOOK_WIDTH, Config.HOOK_HEIGHT) // 2 - 2)
+            # Match the pixel format of loaded sprites for fast blits
+            return placeholder.convert_alpha()
+    except pygame.error:
+        # Create a placeholder on error
+        placeholder = pygame.Surface((Config.HOOK_WIDTH, Config.HOOK_HEIGHT))
+        placeholder.fill((200, 200, 200))
+        return placeholder.convert_alpha()
+
 class FishingLine:
     """Class to manage the fishing line and hook"""
     
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        'player', 'game_state', 'start_pos', 'current_depth', 'descending',
+        'hook_fixed_y', 'hook_image', 'hook_rect', 'horizontal_offset',
+        'max_horizontal_range', 'caught_fish', 'caught_fish_set',
+        'wiggle_table', 'wiggle_index', 'bezier_weights', 'bezier_denominator',
+        'curve_y_key', 'curve_ys'
+    )
+    
     def __init__(self, player, game_state=None):
         self.player = player
         self.game_state = game_state  # Store reference to game state
@@ -20,7 +59,7 @@ class FishingLine:
         self.descending = True
         
         # Fixed hook vertical position (constant screen position)
-        self.hook_fixed_y = Config.SCREEN_HEIGHT // 2  # Middle of the screen
+        self.hook_fixed_y = _HOOK_FIXED_Y
         
         # Hook properties
         self.hook_image = self.load_image("hook.png")
@@ -32,37 +71,46 @@ class FishingLine:
         self.horizontal_offset = 0  # Offset from the rod position
         self.max_horizontal_range = 350  # Maximum horizontal distance from center (increased from 200)
         
-        # Caught fish
+        # Caught fish (list keeps hook order, set gives fast duplicate checks)
         self.caught_fish = []
+        self.caught_fish_set = set()
+        
+        # Ring buffer of pre-rolled wiggle offsets for fish on the hook, so
+        # drawing doesn't need two random calls per fish per frame
+        self.wiggle_table = tuple(
+            random.randint(-3, 3) if random.random() < 0.4 else 0
+            for _ in range(4096)
+        )
+        self.wiggle_index = 0
+        
+        # Quadratic Bezier basis weights for each step of the curved line, as
+        # integers over a common denominator so points need no float math.
+        # The middle weight is applied to twice the control point, which keeps
+        # a half-way control point integral too
+        # Only the curve's end and control points move, so these never change
+        steps = 20
+        self.bezier_weights = tuple(
+            ((steps - i) ** 2, (steps - i) * i, i * i)
+            for i in range(1, steps + 1)
+        )
+        self.bezier_denominator = steps * steps
+        
+        # Cached y coordinates of the curved line and the heights they were built for
+        self.curve_y_key = None
+        self.curve_ys = []
         
     def load_image(self, image_path):
-        """Load an image with error handling and placeholder fallback"""
-        full_path = os.path.join(Config.SPRITE_PATH, image_path)
-        try:
-            if os.path.exists(full_path):
-                return pygame.image.load(full_path).convert_alpha()
-            else:
-                # Create a placeholder image
-                placeholder = pygame.Surface((Config.HOOK_WIDTH, Config.HOOK_HEIGHT))
-                placeholder.fill((200, 200, 200))  # Gray for hook
-                pygame.draw.circle(placeholder, (150, 150, 150), 
-                                  (Config.HOOK_WIDTH // 2, Config.HOOK_HEIGHT // 2), 
-                                  min(Config.HOOK_WIDTH, Config.HOOK_HEIGHT) // 2 - 2)
-                return placeholder
-        except pygame.error:
-            # Create a placeholder on error
-            placeholder = pygame.Surface((Config.HOOK_WIDTH, Config.HOOK_HEIGHT))
-            placeholder.fill((200, 200, 200))
-            return placeholder
+        """Load an image with error handling and placeholder fallback (cached per path)"""
+        return _load_line_image(image_path)
             
     def update(self):
         """Update fishing line and hook position"""
         # Update start position (in case player moved)
-        self.start_pos = self.player.get_rod_position()
+        self.start_pos = start_pos = self.player.get_rod_position()
         
         if self.descending:
             # Increase virtual depth (camera will follow)
-            self.current_depth += Config.BASE_LINE_SPEED
+            self.current_depth += _LINE_SPEED
             
             # Check if max depth reached
             if self.current_depth >= self.get_max_depth():
@@ -71,7 +119,7 @@ class FishingLine:
                 # self.descending = False
         else:
             # Only used when manually reeling in (e.g., when round ends)
-            self.current_depth -= Config.BASE_REEL_SPEED
+            self.current_depth -= _REEL_SPEED
             
             # Check if fully reeled in
             if self.current_depth <= 0:
@@ -80,18 +128,20 @@ class FishingLine:
                 self.descending = True
                 self.horizontal_offset = 0
                 self.caught_fish = []
+                self.caught_fish_set = set()
                 
         # Update hook position - only horizontal position changes
         # Vertical position stays fixed at hook_fixed_y
-        self.hook_rect.centerx = self.start_pos[0] + self.horizontal_offset
+        self.hook_rect.centerx = start_pos[0] + self.horizontal_offset
         self.hook_rect.top = self.hook_fixed_y
         
     def add_caught_fish(self, fish):
         """Add a fish to the caught list if there's capacity"""
         if len(self.caught_fish) < self.get_hook_capacity():
             # Check if this fish is already caught (prevent duplicates)
-            if fish not in self.caught_fish:
+            if fish not in self.caught_fish_set:
                 self.caught_fish.append(fish)
+                self.caught_fish_set.add(fish)
                 # Don't change depth or direction when catching a fish
                 return True
         return False
@@ -123,6 +173,7 @@ class FishingLine:
         self.descending = True
         self.horizontal_offset = 0
         self.caught_fish = []
+        self.caught_fish_set = set()
         
     def full_reset(self):
         """Completely reset the fishing line including depth"""
@@ -130,6 +181,7 @@ class FishingLine:
         self.descending = True
         self.horizontal_offset = 0
         self.caught_fish = []
+        self.caught_fish_set = set()
         
     def get_max_depth(self):
         """Get the maximum depth from game state"""
@@ -148,48 +200,66 @@ class FishingLine:
         
     def draw(self, surface):
         """Draw the fishing line and hook"""
+        # Read the line's end points once
+        start_x, start_y = self.start_pos
+        hook_x, hook_y = self.hook_rect.centerx, self.hook_rect.top
+        
         # Draw the line (curved based on horizontal offset)
-        if abs(self.horizontal_offset) > 10:
+        horizontal_offset = self.horizontal_offset
+        if horizontal_offset > _CURVE_THRESHOLD or horizontal_offset < -_CURVE_THRESHOLD:
             # Draw a curved line when there's significant horizontal offset
-            # Calculate control point for the curve
-            control_point_x = self.start_pos[0] + (self.horizontal_offset * 0.5)
+            # Calculate control point for the curve, doubled to stay an integer
+            control_point_x2 = 2 * start_x + horizontal_offset
             # Control point y is halfway between start and hook
-            control_point_y = self.start_pos[1] + (self.hook_fixed_y - self.start_pos[1]) * 0.5
+            control_point_y2 = start_y + self.hook_fixed_y
+            denominator = self.bezier_denominator
             
-            # Draw the curved line using multiple short line segments
-            steps = 20
-            prev_point = self.start_pos
+            # The curve's vertical profile only depends on the start, control and
+            # hook heights, which don't move, so reuse it until one of them changes
+            curve_y_key = (start_y, control_point_y2, hook_y)
+            if curve_y_key != self.curve_y_key:
+                self.curve_y_key = curve_y_key
+                self.curve_ys = [
+                    (w0 * start_y + w1 * control_point_y2 + w2 * hook_y) // denominator
+                    for w0, w1, w2 in self.bezier_weights
+                ]
             
-            for i in range(1, steps + 1):
-                t = i / steps
-                # Quadratic Bezier curve formula
-                x = (1-t)**2 * self.start_pos[0] + 2*(1-t)*t * control_point_x + t**2 * self.hook_rect.centerx
-                y = (1-t)**2 * self.start_pos[1] + 2*(1-t)*t * control_point_y + t**2 * self.hook_rect.top
-                
-                current_point = (int(x), int(y))
-                pygame.draw.line(surface, Config.LINE_COLOR, prev_point, current_point, 2)
-                prev_point = current_point
+            # Sample the quadratic Bezier curve with the precomputed weights
+            points = [self.start_pos]
+            points += [
+                ((w0 * start_x + w1 * control_point_x2 + w2 * hook_x) // denominator, y)
+                for (w0, w1, w2), y in zip(self.bezier_weights, self.curve_ys)
+            ]
         else:
             # Draw a straight line when there's minimal horizontal offset
-            pygame.draw.line(
-                surface,
-                Config.LINE_COLOR,
-                self.start_pos,
-                (self.hook_rect.centerx, self.hook_rect.top),
-                2
-            )
+            points = [self.start_pos, (hook_x, hook_y)]
+            
+        # Continue the line up from the hook through each caught fish's attachment point
+        points += [(hook_x, hook_y - (i + 1) * 30) for i in range(len(self.caught_fish))]
+        
+        # Draw the whole line as one polyline instead of one call per segment
+        pygame.draw.lines(surface, _LINE_COLOR, False, points, 2)
         
         # Draw the hook
         surface.blit(self.hook_image, self.hook_rect)
         
-        # Draw caught fish
+        # Draw caught fish, batched into a single blits call
+        fish_blits = []
+        wiggle_table = self.wiggle_table
+        wiggle_index = self.wiggle_index
         for i, fish in enumerate(self.caught_fish):
             # Position fish along the line above the hook
             offset = (i + 1) * 30  # Space fish 30 pixels apart
             
             # Add a small wiggle effect for more natural movement
-            wiggle_x = random.randint(-3, 3) if random.random() < 0.4 else 0
+            wiggle_x = wiggle_table[(wiggle_index + i) % len(wiggle_table)]
             
             # Position fish with wiggle effect
-            fish_pos = (self.hook_rect.centerx + wiggle_x, self.hook_rect.top - offset)
-            fish.draw_on_hook(surface, fish_pos)
+            fish_pos = (hook_x + wiggle_x, hook_y - offset)
+            fish_blits.append(fish.get_hook_blit(fish_pos))
+            
+        if fish_blits:
+            surface.blits(fish_blits, doreturn=0)
+            
+            # Advance past the wiggle offsets used this frame
+            self.wiggle_index = (wiggle_index + len(fish_blits)) % len(wiggle_table)
@@ -6,9 +6,34 @@ import os
 import json
 from config import Config
 
+# Use orjson for faster save encoding/decoding when it's installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _encode_save(save_data):
+    """Encode save data as JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(save_data)
+    return json.dumps(save_data).encode("utf-8")
+    
+def _decode_save(raw):
+    """Decode save data from JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 class GameState:
     """Class to manage game state, including coins, upgrades, and progression"""
     
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        'coins', 'upgrades', 'power_ups', 'unlocked_zones',
+        'total_fish_caught', 'total_coins_earned', 'deepest_depth_reached',
+        '_max_depth', '_hook_capacity', '_round_duration', '_dirty'
+    )
+    
     def __init__(self):
         # Player currency
         self.coins = 0
@@ -36,10 +61,17 @@ class GameState:
         self.total_coins_earned = 0
         self.deepest_depth_reached = 0
         
+        # Values derived from upgrade levels, cached until the levels change
+        self._recompute_derived()
+        
+        # Whether anything has changed since the last save or load
+        self._dirty = False
+        
     def add_coins(self, amount):
         """Add coins to the player's balance"""
         self.coins += amount
         self.total_coins_earned += amount
+        self._dirty = True
         
     def get_coins(self):
         """Get the current coin balance"""
@@ -71,6 +103,10 @@ class GameState:
         # Update unlocked zones based on line_length upgrade
         self._update_unlocked_zones()
         
+        # Refresh values that depend on upgrade levels
+        self._recompute_derived()
+        
+        self._dirty = True
         return True
         
     def purchase_power_up(self, power_up_name, cost):
@@ -87,6 +123,7 @@ class GameState:
         # Purchase the power-up
         self.coins -= cost
         self.power_ups[power_up_name] += 1
+        self._dirty = True
         return True
         
     def use_power_up(self, power_up_name):
@@ -102,34 +139,46 @@ class GameState:
             
         # Use the power-up
         self.power_ups[power_up_name] -= 1
+        self._dirty = True
         return True
         
-    def get_max_depth(self):
-        """Get the maximum depth the player can reach based on upgrades"""
+    def _recompute_derived(self):
+        """Recompute the cached values that depend on upgrade levels"""
+        # Max depth the player can reach
         base_depth = Config.BASE_MAX_DEPTH
         depth_increase = self.upgrades["line_length"] * Config.DEPTH_INCREASE_PER_LEVEL
-        return base_depth + depth_increase
+        self._max_depth = base_depth + depth_increase
+        
+        # Hook capacity
+        base_capacity = Config.BASE_HOOK_CAPACITY
+        capacity_increase = self.upgrades["hook_capacity"] * Config.CAPACITY_INCREASE_PER_LEVEL
+        self._hook_capacity = base_capacity + capacity_increase
+        
+        # Round duration in milliseconds
+        base_duration = Config.BASE_ROUND_DURATION
+        duration_increase = self.upgrades["round_timer"] * Config.TIMER_INCREASE_PER_LEVEL
+        self._round_duration = base_duration + duration_increase
+        
+    def get_max_depth(self):
+        """Get the maximum depth the player can reach based on upgrades"""
+        return self._max_depth
         
     # Removed get_reel_speed method as the reel_speed upgrade has been removed
         
     def get_hook_capacity(self):
         """Get the hook capacity based on upgrades"""
-        base_capacity = Config.BASE_HOOK_CAPACITY
-        capacity_increase = self.upgrades["hook_capacity"] * Config.CAPACITY_INCREASE_PER_LEVEL
-        return base_capacity + capacity_increase
+        return self._hook_capacity
         
     def get_round_duration(self):
         """Get the round duration in milliseconds based on upgrades"""
-        base_duration = Config.BASE_ROUND_DURATION
-        duration_increase = self.upgrades["round_timer"] * Config.TIMER_INCREASE_PER_LEVEL
-        return base_duration + duration_increase
+        return self._round_duration
         
     def _update_unlocked_zones(self):
         """Update the unlocked depth zones based on line_length upgrade"""
-        zones = list(Config.DEPTH_ZONES.keys())
+        zones = Config.DEPTH_ZONE_NAMES
         # The number of zones unlocked is based on line_length upgrade level + 1 (for the starting zone)
         unlocked_count = min(len(zones), self.upgrades["line_length"] + 1)
-        self.unlocked_zones = zones[:unlocked_count]
+        self.unlocked_zones = list(zones[:unlocked_count])
         
     def get_unlocked_zones(self):
         """Get the list of unlocked depth zones"""
@@ -140,10 +189,11 @@ class GameState:
         self.total_fish_caught += fish_caught
         if depth > self.deepest_depth_reached:
             self.deepest_depth_reached = depth
+        self._dirty = True
             
-    def save_game(self):
-        """Save the game state to a file"""
-        save_data = {
+    def get_save_data(self):
+        """Get the game state as a plain dict for saving"""
+        return {
             "coins": self.coins,
             "upgrades": self.upgrades,
             "power_ups": self.power_ups,
@@ -155,19 +205,31 @@ class GameState:
             }
         }
         
+    def save_game(self):
+        """Save the game state to a file"""
+        # Nothing to write if the state hasn't changed since the last save or load
+        if not self._dirty:
+            return
+            
+        save_data = self.get_save_data()
+        
         # Create saves directory if it doesn't exist
         os.makedirs(os.path.dirname(Config.SAVE_FILE), exist_ok=True)
         
-        # Save to file
-        with open(Config.SAVE_FILE, 'w') as f:
-            json.dump(save_data, f)
-            
+        # Write to a temporary file and swap it in, so a crash mid-write
+        # can't leave a half-written save behind
+        tmp_path = Config.SAVE_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_encode_save(save_data))
+        os.replace(tmp_path, Config.SAVE_FILE)
+        self._dirty = False
+        
     def load_game(self):
         """Load the game state from a file if it exists"""
         try:
             if os.path.exists(Config.SAVE_FILE):
-                with open(Config.SAVE_FILE, 'r') as f:
-                    save_data = json.load(f)
+                with open(Config.SAVE_FILE, 'rb') as f:
+                    save_data = _decode_save(f.read())
                     
                     # Load saved data
                     self.coins = save_data.get("coins", 0)
@@ -181,6 +243,11 @@ class GameState:
                     self.total_coins_earned = stats.get("total_coins_earned", 0)
                     self.deepest_depth_reached = stats.get("deepest_depth_reached", 0)
                     
+                # Refresh values that depend on the loaded upgrade levels
+                self._recompute_derived()
+                
+                # The in-memory state now matches the save file
+                self._dirty = False
                 return True
         except Exception as e:
             print(f"Error loading game: {e}")
@@ -209,11 +276,16 @@ class GameState:
         # Reset unlocked zones
         self.unlocked_zones = ["surface"]
         
+        # Refresh values that depend on upgrade levels
+        self._recompute_derived()
+        
         # Reset stats
         self.total_fish_caught = 0
         self.total_coins_earned = 0
         self.deepest_depth_reached = 0
         
+        self._dirty = True
+        
         # Optionally, save the reset state immediately
         # self.save_game() 
         # Or let the game handle saving at the appropriate time
@@ -5,7 +5,7 @@ Main game script containing initialization and game loop
 """
 import pygame
 import sys
-from enum import Enum
+from enum import IntEnum
 
 # Import game modules
 # These will be created in separate files
@@ -15,14 +15,19 @@ from player import Player
 from fishing import FishingLine
 from fish import FishManager
 from ui import UI
-from sound import SoundManager
+from sound import SoundManager, SFX_CAST, SFX_CATCH, SFX_REEL_COMPLETE, SFX_PURCHASE, SFX_RESET
 
-class GameScreen(Enum):
-    """Enum for different game screens/states"""
+class GameScreen(IntEnum):
+    """Enum for different game screens/states (compares as a plain int)"""
     MAIN_GAME = 0
     RESULTS = 1
     SHOP = 2
 
+# Module-level aliases so per-frame screen checks are a global lookup and an int compare
+MAIN_GAME = GameScreen.MAIN_GAME
+RESULTS = GameScreen.RESULTS
+SHOP = GameScreen.SHOP
+
 class Game:
     """Main game class that manages the game loop and states"""
     
@@ -43,8 +48,12 @@ class Game:
         self.ui = UI(self.game_state)
         self.sound_manager = SoundManager()
         
+        # The player doesn't move, so the rod's x position is fixed
+        self.rod_pos_x = self.player.get_rod_position()[0]
+        
         # Game state variables
-        self.current_screen = GameScreen.MAIN_GAME
+        self.current_screen = MAIN_GAME
+        self.rendered_screen = None  # Screen drawn last frame (None forces a full redraw)
         self.round_active = False
         self.round_start_time = 0
         self.round_timer = 0
@@ -64,7 +73,7 @@ class Game:
         self.fish_manager.reset_round()
         
         # Play casting sound
-        self.sound_manager.play_sfx("cast")
+        self.sound_manager.play_sfx(SFX_CAST)
         
     def end_round(self):
         """End the current fishing round and show results"""
@@ -75,10 +84,10 @@ class Game:
         self.game_state.add_coins(round_value)
         
         # Switch to results screen
-        self.current_screen = GameScreen.RESULTS
+        self.current_screen = RESULTS
         
         # Play round end sound
-        self.sound_manager.play_sfx("reel_complete")
+        self.sound_manager.play_sfx(SFX_REEL_COMPLETE)
         
     def handle_events(self):
         """Process pygame events"""
@@ -86,6 +95,10 @@ class Game:
             if event.type == pygame.QUIT:
                 self.quit_game()
                 
+            if event.type == pygame.WINDOWEXPOSED:
+                # The window's contents need repainting in full
+                self.rendered_screen = None
+                
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.quit_game()
@@ -95,84 +108,81 @@ class Game:
                     mouse_pos = pygame.mouse.get_pos()
                     
                     # Handle clicks based on current screen
-                    if self.current_screen == GameScreen.RESULTS:
+                    if self.current_screen == RESULTS:
                         if self.ui.check_continue_button(mouse_pos):
-                            self.current_screen = GameScreen.SHOP
+                            self.current_screen = SHOP
                             
-                    elif self.current_screen == GameScreen.SHOP:
+                    elif self.current_screen == SHOP:
                         upgrade_clicked = self.ui.check_upgrade_buttons(mouse_pos)
                         if upgrade_clicked:
                             self.game_state.purchase_upgrade(upgrade_clicked)
-                            self.sound_manager.play_sfx("purchase")
+                            self.sound_manager.play_sfx(SFX_PURCHASE)
                             
                         if self.ui.check_start_button(mouse_pos):
-                            self.current_screen = GameScreen.MAIN_GAME
+                            self.current_screen = MAIN_GAME
                             self.start_round()
                         
                         if self.ui.check_reset_button(mouse_pos):
                             # Reset game progress and save state
                             self.game_state.reset_progress()
                             self.game_state.save_game()
-                            self.sound_manager.play_sfx("reset")
+                            self.sound_manager.play_sfx(SFX_RESET)
                             
     def update(self):
         """Update game state"""
         # Get current mouse position for hover detection
         mouse_pos = pygame.mouse.get_pos()
         
-        if self.current_screen == GameScreen.MAIN_GAME:
+        if self.current_screen == MAIN_GAME:
             if self.round_active:
                 # Update round timer
                 current_time = pygame.time.get_ticks()
                 self.round_timer = current_time - self.round_start_time
                 
+                # Bind the components used below to locals once
+                fishing_line = self.fishing_line
+                fish_manager = self.fish_manager
+                
                 # Update fishing line horizontal position based on mouse
-                rod_pos_x = self.player.get_rod_position()[0]
-                # Calculate horizontal offset from rod position to mouse
-                horizontal_offset = mouse_pos[0] - rod_pos_x
-                # Limit the offset to the maximum range
-                max_range = self.fishing_line.max_horizontal_range
-                if horizontal_offset > max_range:
-                    horizontal_offset = max_range
-                elif horizontal_offset < -max_range:
-                    horizontal_offset = -max_range
-                # Set the horizontal offset in the fishing line
-                self.fishing_line.horizontal_offset = horizontal_offset
+                # Horizontal offset from rod position to mouse, limited to the maximum range
+                max_range = fishing_line.max_horizontal_range
+                fishing_line.horizontal_offset = max(-max_range, min(max_range, mouse_pos[0] - self.rod_pos_x))
                 
                 # Update fishing line
-                self.fishing_line.update()
+                fishing_line.update()
                 
                 # Update fish with current depth for camera tracking
-                self.fish_manager.update(self.fishing_line.get_hook_rect(), self.fishing_line.get_current_depth())
+                fish_manager.update(fishing_line.hook_rect, fishing_line.current_depth)
                 
                 # Check for fish catches (hover mechanic)
-                caught_fish = self.fish_manager.check_catches(mouse_pos, self.fishing_line)
+                caught_fish = fish_manager.check_catches(mouse_pos, fishing_line)
                 if caught_fish:
-                    self.sound_manager.play_sfx("catch")
+                    self.sound_manager.play_sfx(SFX_CATCH)
                     
                 # Check if round should end
                 # Only end if timer is up or hook is at capacity
                 if (self.round_timer >= self.game_state.get_round_duration() or
-                    self.fishing_line.is_at_capacity()):
+                    fishing_line.is_at_capacity()):
                     self.end_round()
             else:
                 # If no round is active, start a new one
                 self.start_round()
                 
-        elif self.current_screen == GameScreen.RESULTS:
+        elif self.current_screen == RESULTS:
             # Update results screen animations if any
             pass
             
-        elif self.current_screen == GameScreen.SHOP:
+        elif self.current_screen == SHOP:
             # Update shop screen hover effects
             self.ui.update_shop_hover(mouse_pos)
             
     def render(self):
         """Render the game"""
-        # Clear the screen
-        self.screen.fill(Config.BACKGROUND_COLOR)
+        # No separate clear pass: every screen starts by painting the whole
+        # screen (opaque zone background, or a solid fill for results/shop)
+        dirty_rects = None  # Parts of the screen that changed, if not all of it
         
-        if self.current_screen == GameScreen.MAIN_GAME:
+        if self.current_screen == MAIN_GAME:
             # Draw the background based on depth
             self.fish_manager.draw_background(self.screen, self.fishing_line.get_current_depth())
             
@@ -188,24 +198,37 @@ class Game:
             # Draw UI elements (timer, depth, coins)
             self.ui.draw_game_ui(self.screen, self.round_timer, self.fishing_line.get_current_depth())
             
-        elif self.current_screen == GameScreen.RESULTS:
+        elif self.current_screen == RESULTS:
             # Draw results screen
             self.ui.draw_results(self.screen, self.fish_manager.get_caught_fish())
             
-        elif self.current_screen == GameScreen.SHOP:
-            # Draw shop screen
-            self.ui.draw_shop(self.screen)
+        elif self.current_screen == SHOP:
+            # Draw shop screen (only what changed, if the shop was already showing)
+            dirty_rects = self.ui.draw_shop(self.screen, full_redraw=(self.rendered_screen != SHOP))
             
+        self.rendered_screen = self.current_screen
+        
         # Update the display
-        pygame.display.flip()
+        if dirty_rects is None:
+            pygame.display.flip()
+        elif dirty_rects:
+            # Only copy the changed parts to the window
+            pygame.display.update(dirty_rects)
         
     def run(self):
         """Main game loop"""
+        # Bind per-frame calls to locals once instead of looking them up every frame
+        handle_events = self.handle_events
+        update = self.update
+        render = self.render
+        tick = self.clock.tick
+        fps = Config.FPS
+        
         while True:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(Config.FPS)
+            handle_events()
+            update()
+            render()
+            tick(fps)
             
     def quit_game(self):
         """Save game and exit"""
@@ -4,11 +4,40 @@ Handles the player's boat and fisherman
 """
 import pygame
 import os
+import functools
 from config import Config
 
+@functools.lru_cache(maxsize=None)
+def _load_player_image(image_path):
+    """Load a player image once per path; later calls return the same Surface"""
+    full_path = os.path.join(Config.SPRITE_PATH, image_path)
+    try:
+        if os.path.exists(full_path):
+            return pygame.image.load(full_path).convert_alpha()
+        else:
+            # Create a placeholder image if file doesn't exist
+            placeholder = pygame.Surface((50, 30))
+            if "boat" in image_path:
+                placeholder.fill((139, 69, 19))  # Brown for boat
+            else:
+                placeholder.fill((255, 0, 0))  # Red for fisherman
+            # Match the pixel format of loaded sprites for fast blits
+            return placeholder.convert_alpha()
+    except pygame.error:
+        # Create a placeholder on error
+        placeholder = pygame.Surface((50, 30))
+        placeholder.fill((255, 0, 0))
+        return placeholder.convert_alpha()
+
 class Player:
     """Class to manage the player's boat and fisherman"""
     
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        'x', 'y', 'boat_image', 'fisherman_image', 'boat_rect', 'fisherman_rect',
+        'rod_pos', 'draw_sequence', 'animation_frame', 'animation_timer', 'animation_speed'
+    )
+    
     def __init__(self):
         # Player position (center of boat)
         self.x = Config.PLAYER_POS_X
@@ -34,25 +63,15 @@ class Player:
         # Rod position (where fishing line starts)
         self.rod_pos = (self.x + 20, self.fisherman_rect.centery)
         
+        # Images and positions to blit when drawing (boat first, then fisherman)
+        self.draw_sequence = (
+            (self.boat_image, self.boat_rect),
+            (self.fisherman_image, self.fisherman_rect)
+        )
+        
     def load_image(self, image_path):
-        """Load an image with error handling and placeholder fallback"""
-        full_path = os.path.join(Config.SPRITE_PATH, image_path)
-        try:
-            if os.path.exists(full_path):
-                return pygame.image.load(full_path).convert_alpha()
-            else:
-                # Create a placeholder image if file doesn't exist
-                placeholder = pygame.Surface((50, 30))
-                if "boat" in image_path:
-                    placeholder.fill((139, 69, 19))  # Brown for boat
-                else:
-                    placeholder.fill((255, 0, 0))  # Red for fisherman
-                return placeholder
-        except pygame.error:
-            # Create a placeholder on error
-            placeholder = pygame.Surface((50, 30))
-            placeholder.fill((255, 0, 0))
-            return placeholder
+        """Load an image with error handling and placeholder fallback (cached per path)"""
+        return _load_player_image(image_path)
             
     def update(self):
         """Update player animation"""
@@ -71,11 +90,9 @@ class Player:
         
     def draw(self, surface):
         """Draw the player (boat and fisherman) on the given surface"""
-        # Draw boat
-        surface.blit(self.boat_image, self.boat_rect)
-        
-        # Draw fisherman
-        surface.blit(self.fisherman_image, self.fisherman_rect)
+        # Draw boat, then fisherman on top, in one batched call
+        surface.blits(self.draw_sequence, doreturn=0)
         
         # For debugging, draw the rod position
-        pygame.draw.circle(surface, (255, 0, 0), self.rod_pos, 3)
+        if Config.DEBUG:
+            pygame.draw.circle(surface, (255, 0, 0), self.rod_pos, 3)
@@ -6,6 +6,23 @@ import pygame
 import os
 from config import Config
 
+# Sound effect ids, used as indexes into SoundManager.sfx
+SFX_CAST = 0
+SFX_CATCH = 1
+SFX_REEL_COMPLETE = 2
+SFX_PURCHASE = 3
+SFX_RESET = 4
+
+# Sound effect files and names, in id order
+SFX_FILES = (
+    "sfx/cast.wav",
+    "sfx/catch.wav",
+    "sfx/reel_complete.wav",
+    "sfx/purchase.wav",
+    "sfx/reset.wav"
+)
+SFX_NAMES = ("cast", "catch", "reel_complete", "purchase", "reset")
+
 class SoundManager:
     """Class to manage game sounds and music"""
     
@@ -13,38 +30,46 @@ class SoundManager:
         # Initialize pygame mixer
         pygame.mixer.init()
         
-        # Sound effect dictionary
-        self.sfx = {}
+        # Pool of mixer channels used round-robin for sound effects, so playing
+        # a sound doesn't have to search for a free channel
+        pygame.mixer.set_num_channels(Config.SFX_CHANNELS)
+        self.channels = [pygame.mixer.Channel(i) for i in range(Config.SFX_CHANNELS)]
+        self.channel_volumes = [1.0] * Config.SFX_CHANNELS
+        self.next_channel = 0
+        
+        # Loaded sound effects indexed by id (None if a sound couldn't be loaded)
+        self.sfx = [None] * len(SFX_FILES)
         
         # Load sound effects
         self.load_sound_effects()
         
     def load_sound_effects(self):
         """Load all sound effects"""
-        # Define sound effects to load
-        sound_files = {
-            "cast": "sfx/cast.wav",
-            "catch": "sfx/catch.wav",
-            "reel_complete": "sfx/reel_complete.wav",
-            "purchase": "sfx/purchase.wav",
-            "reset": "sfx/reset.wav"
-        }
-        
         # Load each sound effect
-        for name, file_path in sound_files.items():
+        for sfx_id, file_path in enumerate(SFX_FILES):
             full_path = os.path.join(Config.AUDIO_PATH, file_path)
             try:
                 if os.path.exists(full_path):
-                    self.sfx[name] = pygame.mixer.Sound(full_path)
+                    self.sfx[sfx_id] = pygame.mixer.Sound(full_path)
                 else:
                     print(f"Sound file not found: {full_path}")
             except pygame.error:
                 print(f"Error loading sound: {full_path}")
                 
-    def play_sfx(self, name, volume=1.0):
-        """Play a sound effect by name"""
-        if name in self.sfx:
-            self.sfx[name].set_volume(volume)
-            self.sfx[name].play()
+    def play_sfx(self, sfx_id, volume=1.0):
+        """Play a sound effect by id (one of the SFX_* constants)"""
+        sound = self.sfx[sfx_id]
+        if sound is not None:
+            # Take the next channel in the pool
+            index = self.next_channel
+            self.next_channel = (index + 1) % len(self.channels)
+            channel = self.channels[index]
+            
+            # Channel volume persists between sounds, so only change it when needed
+            if self.channel_volumes[index] != volume:
+                channel.set_volume(volume)
+                self.channel_volumes[index] = volume
+                
+            channel.play(sound)
         else:
-            print(f"Sound effect not found: {name}")
+            print(f"Sound effect not found: {SFX_NAMES[sfx_id]}")
@@ -4,8 +4,32 @@ Handles game UI, menus, and screens
 """
 import pygame
 import os
+import functools
+import bisect
 from config import Config
 
+# Upgrades in the order they're listed in the shop, with their display names and descriptions
+UPGRADE_ORDER = ("line_length", "hook_capacity", "round_timer")
+UPGRADE_NAMES = {
+    "line_length": "Line Length",
+    "hook_capacity": "Hook Capacity",
+    "round_timer": "Round Timer"
+}
+UPGRADE_DESCRIPTIONS = {
+    "line_length": "Increases maximum fishing depth",
+    "hook_capacity": "Increases number of fish you can catch",
+    "round_timer": "Increases round duration"
+}
+
+@functools.lru_cache(maxsize=256)
+def _render_text(font, text, color, shadow):
+    """Render text (and its shadow) once per font/text/color; later calls reuse the Surfaces"""
+    text_surface = font.render(text, True, color)
+    shadow_surface = font.render(text, True, Config.TEXT_SHADOW_COLOR) if shadow else None
+    # Half the size, for centering without building a Rect (the shadow is the same size)
+    width, height = text_surface.get_size()
+    return text_surface, shadow_surface, width // 2, height // 2
+
 class UI:
     """Class to manage game UI, menus, and screens"""
     
@@ -14,29 +38,68 @@ class UI:
         
         # Load fonts
         pygame.font.init()
-        self.font_small = pygame.font.SysFont("Arial", 20)
-        self.font_medium = pygame.font.SysFont("Arial", 24)
-        self.font_large = pygame.font.SysFont("Arial", 32)
+        fonts = None
         
         # Try to load custom font if available
         try:
             font_path = os.path.join(Config.FONT_PATH, "game_font.ttf")
             if os.path.exists(font_path):
-                self.font_small = pygame.font.Font(font_path, 20)
-                self.font_medium = pygame.font.Font(font_path, 24)
-                self.font_large = pygame.font.Font(font_path, 32)
+                fonts = [pygame.font.Font(font_path, size) for size in (20, 24, 32)]
         except pygame.error:
             pass  # Fall back to system font
             
+        # Only look up the system font when it's needed, since SysFont has to
+        # search the installed fonts
+        if fonts is None:
+            fonts = [pygame.font.SysFont("Arial", size) for size in (20, 24, 32)]
+            
+        self.font_small, self.font_medium, self.font_large = fonts
+            
         # UI elements
         self.buttons = {}
         self.hover_button = None
+        self.hover_changed = False  # Set when the hovered shop button changes, until it's drawn
+        
+        # Pre-rendered shop background (fill, titles, coins, upgrade info), each
+        # upgrade's (cost_text, can_afford, is_max) status, and the coins/upgrade
+        # levels they were built for
+        self.shop_background = None
+        self.upgrade_status = {}
+        self.shop_key = None
+        
+        # Shop key and buttons as last drawn to the screen, for redrawing only what changed
+        self.shop_drawn_key = None
+        self.shop_drawn_buttons = []
+        
+        # HUD label blits (text with its shadow composited in) and the value each
+        # was formatted for, keyed by label
+        self.hud_labels = {}
+        
+        # Pre-rendered results screen (everything but the button) and the catch it shows
+        self.results_background = None
+        self.results_key = None
+        
+        # Pre-rendered button backgrounds (fill and border), keyed by size and color
+        self.button_sprites = {}
         
         # Initialize UI elements
         self.init_ui_elements()
         
+        # Render every button background up front so no sprite is drawn mid-frame
+        button_size = (Config.BUTTON_WIDTH, Config.BUTTON_HEIGHT)
+        for color in (Config.BUTTON_COLOR, Config.BUTTON_HOVER_COLOR, Config.BUTTON_DISABLED_COLOR):
+            self.get_button_sprite(button_size, color)
+        
     def init_ui_elements(self):
         """Initialize UI elements like buttons"""
+        # Fixed text positions, computed once instead of every frame
+        self.center_x = Config.SCREEN_WIDTH // 2
+        self.pos_time = (self.center_x, 30)
+        self.pos_depth = (Config.SCREEN_WIDTH - 100, 30)
+        self.pos_coins = (100, 30)
+        self.pos_title = (self.center_x, 50)
+        self.pos_subtitle = (self.center_x, 100)
+        
         # Continue button for results screen
         self.buttons["continue"] = pygame.Rect(
             Config.SCREEN_WIDTH // 2 - Config.BUTTON_WIDTH // 2,
@@ -63,7 +126,7 @@ class UI:
         
         # Upgrade buttons
         upgrade_y = 180
-        for upgrade in ["line_length", "hook_capacity", "round_timer"]:
+        for upgrade in UPGRADE_ORDER:
             self.buttons[upgrade] = pygame.Rect(
                 Config.SCREEN_WIDTH - Config.BUTTON_WIDTH - Config.UI_PADDING,
                 upgrade_y,
@@ -72,78 +135,134 @@ class UI:
             )
             upgrade_y += Config.BUTTON_HEIGHT + 20
             
+        # Shop buttons as (top, bottom, left, right, id) bands sorted by top edge
+        # The shop's buttons never share a vertical range, so a bisect on y finds
+        # the only button the mouse can be over
+        self.shop_bands = sorted(
+            (rect.top, rect.bottom, rect.left, rect.right, button_id)
+            for button_id, rect in self.buttons.items()
+            if button_id != "continue"  # Results screen only
+        )
+        self.shop_band_tops = [band[0] for band in self.shop_bands]
+        
+    def get_text_blits(self, text, font, color, position, shadow=True):
+        """Get the (Surface, position) pairs that draw text centered on position, shadow first"""
+        # Rendered Surfaces are cached, so unchanged text isn't rasterized every frame
+        text_surface, shadow_surface, half_width, half_height = _render_text(font, text, color, shadow)
+        
+        # Top-left corner that centers the text on position
+        x = position[0] - half_width
+        y = position[1] - half_height
+        
+        if shadow:
+            return ((shadow_surface, (x + 2, y + 2)), (text_surface, (x, y)))
+        return ((text_surface, (x, y)),)
+        
     def draw_text(self, surface, text, font, color, position, shadow=True):
         """Draw text with optional shadow"""
-        if shadow:
-            shadow_surface = font.render(text, True, Config.TEXT_SHADOW_COLOR)
-            shadow_rect = shadow_surface.get_rect(center=(position[0] + 2, position[1] + 2))
-            surface.blit(shadow_surface, shadow_rect)
+        surface.blits(self.get_text_blits(text, font, color, position, shadow), doreturn=0)
+        
+    def get_button_sprite(self, size, color):
+        """Get a button background of the given size and color, rendering it on first use"""
+        key = (size, color)
+        sprite = self.button_sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            sprite_rect = sprite.get_rect()
+            
+            # Draw button background
+            pygame.draw.rect(sprite, color, sprite_rect, border_radius=Config.BUTTON_RADIUS)
+            
+            # Draw button border
+            pygame.draw.rect(sprite, (0, 0, 0), sprite_rect, 2, border_radius=Config.BUTTON_RADIUS)
+            
+            self.button_sprites[key] = sprite
+        return sprite
+        
+    def draw_buttons(self, surface, buttons):
+        """Draw buttons given as (rect, text, font, color) with a single blits call"""
+        # Every button background first...
+        blits = [(self.get_button_sprite(rect.size, color), rect) for rect, _, _, color in buttons]
+        
+        # ...then every button's text on top
+        get_text_blits = self.get_text_blits
+        text_color = Config.BUTTON_TEXT_COLOR
+        for rect, text, font, _ in buttons:
+            blits += get_text_blits(text, font, text_color, rect.center)
             
-        text_surface = font.render(text, True, color)
-        text_rect = text_surface.get_rect(center=position)
-        surface.blit(text_surface, text_rect)
+        surface.blits(blits, doreturn=0)
         
     def draw_button(self, surface, rect, text, hover=False):
         """Draw a button with text"""
-        # Draw button background
         color = Config.BUTTON_HOVER_COLOR if hover else Config.BUTTON_COLOR
-        pygame.draw.rect(surface, color, rect, border_radius=Config.BUTTON_RADIUS)
-        
-        # Draw button border
-        pygame.draw.rect(surface, (0, 0, 0), rect, 2, border_radius=Config.BUTTON_RADIUS)
-        
-        # Draw button text
         font = self.font_small if text == "Continue to Shop" else self.font_medium
-        self.draw_text(
-            surface,
-            text,
-            font,
-            Config.BUTTON_TEXT_COLOR,
-            rect.center
+        self.draw_buttons(surface, ((rect, text, font, color),))
+        
+    def get_hud_blits(self, label_format, value, position):
+        """Get the blits for a HUD label, only formatting it again when its value changes"""
+        cached = self.hud_labels.get(label_format)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+            
+        text_surface, shadow_surface, half_width, half_height = _render_text(
+            self.font_medium, label_format.format(value), Config.TEXT_COLOR, True
         )
         
+        # Bake the shadow into one Surface with the text, so the HUD needs a
+        # single blit per label each frame instead of two
+        width, height = text_surface.get_size()
+        label = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA).convert_alpha()
+        label.blit(shadow_surface, (2, 2))
+        label.blit(text_surface, (0, 0))
+        
+        blits = ((label, (position[0] - half_width, position[1] - half_height)),)
+        self.hud_labels[label_format] = (value, blits)
+        return blits
+        
     def draw_game_ui(self, surface, round_timer, current_depth):
         """Draw in-game UI elements"""
-        # Draw timer
         time_left = max(0, (self.game_state.get_round_duration() - round_timer) // 1000)
-        self.draw_text(
-            surface,
-            f"Time: {time_left}s",
-            self.font_medium,
-            Config.TEXT_COLOR,
-            (Config.SCREEN_WIDTH // 2, 30)
-        )
         
-        # Draw depth
-        self.draw_text(
-            surface,
-            f"Depth: {int(current_depth)}m",
-            self.font_medium,
-            Config.TEXT_COLOR,
-            (Config.SCREEN_WIDTH - 100, 30)
+        # Draw timer, depth and coins together
+        surface.blits(
+            self.get_hud_blits("Time: {}s", time_left, self.pos_time)
+            + self.get_hud_blits("Depth: {}m", int(current_depth), self.pos_depth)
+            + self.get_hud_blits("Coins: {}", self.game_state.get_coins(), self.pos_coins),
+            doreturn=0
         )
         
-        # Draw coins
-        self.draw_text(
+    def draw_results(self, surface, caught_fish):
+        """Draw the results screen"""
+        # The results only change when there's a new catch to show, so they're
+        # drawn once into a cached Surface and rebuilt for each new catch
+        results_key = tuple(caught_fish)
+        if results_key != self.results_key:
+            self.results_key = results_key
+            self.results_background = self.build_results_background(caught_fish)
+        surface.blit(self.results_background, (0, 0))
+        
+        # Continue button
+        self.draw_button(
             surface,
-            f"Coins: {self.game_state.get_coins()}",
-            self.font_medium,
-            Config.TEXT_COLOR,
-            (100, 30)
+            self.buttons["continue"],
+            "Continue to Shop",
+            hover=(self.hover_button == "continue")
         )
         
-    def draw_results(self, surface, caught_fish):
-        """Draw the results screen"""
+    def build_results_background(self, caught_fish):
+        """Draw the results screen, except the button, into a new screen-sized Surface"""
+        background = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)).convert()
+        
         # Background
-        surface.fill((0, 50, 100))  # Dark blue background
+        background.fill((0, 50, 100))  # Dark blue background
         
         # Title
         self.draw_text(
-            surface,
+            background,
             "Round Results",
             self.font_large,
             Config.TEXT_COLOR,
-            (Config.SCREEN_WIDTH // 2, 50)
+            self.pos_title
         )
         
         # Calculate total value
@@ -151,11 +270,11 @@ class UI:
         
         # Show total
         self.draw_text(
-            surface,
+            background,
             f"Total Catch Value: {total_value} coins",
             self.font_medium,
             Config.TEXT_COLOR,
-            (Config.SCREEN_WIDTH // 2, 100)
+            self.pos_subtitle
         )
         
         # List caught fish
@@ -163,108 +282,131 @@ class UI:
         if caught_fish:
             for fish in caught_fish:
                 self.draw_text(
-                    surface,
+                    background,
                     f"{fish.get_name()} ({fish.get_rarity()}) - {fish.get_value()} coins",
                     self.font_small,
                     Config.TEXT_COLOR,
-                    (Config.SCREEN_WIDTH // 2, y_pos)
+                    (self.center_x, y_pos)
                 )
                 y_pos += 30
         else:
             self.draw_text(
-                surface,
+                background,
                 "No fish caught!",
                 self.font_medium,
                 Config.TEXT_COLOR,
-                (Config.SCREEN_WIDTH // 2, y_pos)
+                (self.center_x, y_pos)
             )
             
-        # Continue button
-        self.draw_button(
-            surface,
-            self.buttons["continue"],
-            "Continue to Shop",
-            hover=(self.hover_button == "continue")
-        )
+        return background
+        
+    def draw_shop(self, surface, full_redraw=True):
+        """
+        Draw the shop screen
+        Returns the list of rects that changed, for pygame.display.update
+        Unless full_redraw is set, surface is assumed to still hold the last shop frame
+        """
+        # Everything except the buttons only changes with coins or upgrade levels,
+        # so it's drawn once into a cached Surface and rebuilt when those change
+        self.refresh_shop(self.game_state.get_coins())
+        
+        # Nothing to draw if the hover and the shop's state are the same as last frame
+        if not full_redraw and not self.hover_changed and self.shop_key == self.shop_drawn_key:
+            return []
+        self.hover_changed = False
+        
+        # Upgrade buttons
+        buttons = self.get_upgrade_buttons()
+        
+        # Reset and start buttons
+        hover_button = self.hover_button
+        button_color = Config.BUTTON_COLOR
+        hover_color = Config.BUTTON_HOVER_COLOR
+        for button_id, text in (("reset", "Reset Progress"), ("start", "Start Fishing")):
+            color = hover_color if hover_button == button_id else button_color
+            buttons.append((self.buttons[button_id], text, self.font_medium, color))
+            
+        if full_redraw or self.shop_key != self.shop_drawn_key:
+            # Draw the whole screen
+            surface.blit(self.shop_background, (0, 0))
+            self.draw_buttons(surface, buttons)
+            dirty_rects = [surface.get_rect()]
+        else:
+            # Only redraw buttons whose look changed (normally just hover changes),
+            # restoring the background behind each one first
+            changed = [
+                button for button, drawn in zip(buttons, self.shop_drawn_buttons)
+                if button != drawn
+            ]
+            for rect, _, _, _ in changed:
+                surface.blit(self.shop_background, rect, rect)
+            self.draw_buttons(surface, changed)
+            dirty_rects = [rect for rect, _, _, _ in changed]
+            
+        self.shop_drawn_key = self.shop_key
+        self.shop_drawn_buttons = buttons
+        return dirty_rects
+        
+    def refresh_shop(self, coins):
+        """Rebuild the shop background and upgrade status if coins or upgrade levels changed"""
+        shop_key = (coins, tuple(self.game_state.upgrades.values()))
+        if shop_key != self.shop_key:
+            self.shop_key = shop_key
+            self.upgrade_status = self.build_upgrade_status(coins)
+            self.shop_background = self.build_shop_background(coins)
+            
+    def build_upgrade_status(self, coins):
+        """Get each upgrade's (cost_text, can_afford, is_max) status for the given coins"""
+        upgrade_status = {}
+        for upgrade_id, level in self.game_state.upgrades.items():
+            # Check if max level reached
+            if level >= len(Config.UPGRADE_COSTS[upgrade_id]):
+                upgrade_status[upgrade_id] = ("MAX", False, True)
+            else:
+                cost = Config.UPGRADE_COSTS[upgrade_id][level]
+                upgrade_status[upgrade_id] = (f"{cost} coins", coins >= cost, False)
+        return upgrade_status
+        
+    def build_shop_background(self, coins):
+        """Draw the static parts of the shop screen into a new screen-sized Surface"""
+        background = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)).convert()
         
-    def draw_shop(self, surface):
-        """Draw the shop screen"""
         # Background
-        surface.fill((50, 30, 80))  # Purple-ish background
+        background.fill((50, 30, 80))  # Purple-ish background
         
         # Title
         self.draw_text(
-            surface,
+            background,
             "Upgrade Shop",
             self.font_large,
             Config.TEXT_COLOR,
-            (Config.SCREEN_WIDTH // 2, 50)
+            self.pos_title
         )
         
         # Show coins
         self.draw_text(
-            surface,
-            f"Coins: {self.game_state.get_coins()}",
+            background,
+            f"Coins: {coins}",
             self.font_medium,
             Config.TEXT_COLOR,
-            (Config.SCREEN_WIDTH // 2, 100)
+            self.pos_subtitle
         )
         
-        # Draw upgrade buttons and info
-        self.draw_upgrades(surface)
-        
-        # Reset button
-        self.draw_button(
-            surface,
-            self.buttons["reset"],
-            "Reset Progress",
-            hover=(self.hover_button == "reset")
-        )
+        # Draw upgrade info
+        self.draw_upgrade_info(background)
         
-        # Start button
-        self.draw_button(
-            surface,
-            self.buttons["start"],
-            "Start Fishing",
-            hover=(self.hover_button == "start")
-        )
+        return background
         
-    def draw_upgrades(self, surface):
-        """Draw upgrade options"""
-        # Upgrade names and descriptions
-        upgrades = {
-            "line_length": "Line Length",
-            "hook_capacity": "Hook Capacity",
-            "round_timer": "Round Timer"
-        }
-        
-        descriptions = {
-            "line_length": "Increases maximum fishing depth",
-            "hook_capacity": "Increases number of fish you can catch",
-            "round_timer": "Increases round duration"
-        }
-        
-        # Draw each upgrade option
-        for upgrade_id, upgrade_name in upgrades.items():
-            # Get current level and cost
+    def draw_upgrade_info(self, surface):
+        """Draw the name, level and description next to each upgrade button"""
+        for upgrade_id in UPGRADE_ORDER:
             level = self.game_state.upgrades[upgrade_id]
-            
-            # Check if max level reached
-            if level >= len(Config.UPGRADE_COSTS[upgrade_id]):
-                cost_text = "MAX"
-                can_afford = False
-            else:
-                cost = Config.UPGRADE_COSTS[upgrade_id][level]
-                cost_text = f"{cost} coins"
-                can_afford = self.game_state.get_coins() >= cost
-                
-            # Get button position
             button_rect = self.buttons[upgrade_id]
             
             # Draw upgrade info
             self.draw_text(
                 surface,
-                f"{upgrade_name} (Level {level})",
+                f"{UPGRADE_NAMES[upgrade_id]} (Level {level})",
                 self.font_medium,
                 Config.TEXT_COLOR,
                 (230, button_rect.y + 10)  
@@ -273,52 +415,68 @@ class UI:
             # Draw description
             self.draw_text(
                 surface,
-                descriptions[upgrade_id],
+                UPGRADE_DESCRIPTIONS[upgrade_id],
                 self.font_small,
                 Config.TEXT_COLOR,
                 (230, button_rect.y + 35)  
             )
             
-            # Draw button
-            button_color = Config.BUTTON_COLOR
-            if not can_afford and cost_text != "MAX":
-                button_color = (100, 100, 100)  # Gray out if can't afford
-                
-            hover = (self.hover_button == upgrade_id and can_afford and cost_text != "MAX")
-            
-            pygame.draw.rect(
-                surface,
-                button_color if not hover else Config.BUTTON_HOVER_COLOR,
-                button_rect,
-                border_radius=Config.BUTTON_RADIUS
-            )
+    def get_upgrade_buttons(self):
+        """Get the upgrade buttons to draw as (rect, text, font, color) entries"""
+        buttons = []
+        upgrade_status = self.upgrade_status
+        
+        # Bind the values used for every button to locals once
+        hover_button = self.hover_button
+        font = self.font_small
+        normal_color = Config.BUTTON_COLOR
+        disabled_color = Config.BUTTON_DISABLED_COLOR
+        hover_color = Config.BUTTON_HOVER_COLOR
+        
+        for upgrade_id in UPGRADE_ORDER:
+            # Cost and availability, worked out when coins or levels last changed
+            cost_text, can_afford, is_max = upgrade_status[upgrade_id]
             
-            pygame.draw.rect(
-                surface,
-                (0, 0, 0),
-                button_rect,
-                2,
-                border_radius=Config.BUTTON_RADIUS
-            )
+            # Get button position
+            button_rect = self.buttons[upgrade_id]
             
-            self.draw_text(
-                surface,
-                cost_text,
-                self.font_small,
-                Config.BUTTON_TEXT_COLOR,
-                button_rect.center
-            )
+            # Button color
+            button_color = normal_color
+            if not can_afford and not is_max:
+                button_color = disabled_color  # Gray out if can't afford
+                
+            hover = (hover_button == upgrade_id and can_afford)
+            if hover:
+                button_color = hover_color
+                
+            buttons.append((button_rect, cost_text, font, button_color))
             
+        return buttons
+        
+    def get_shop_button(self, mouse_pos):
+        """Get the id of the shop button under the mouse, or None"""
+        x, y = mouse_pos
+        index = bisect.bisect_right(self.shop_band_tops, y) - 1
+        if index >= 0:
+            top, bottom, left, right, button_id = self.shop_bands[index]
+            if y < bottom and left <= x < right:
+                return button_id
+        return None
+        
     def update_shop_hover(self, mouse_pos):
-        """Update hover state for shop buttons"""
-        self.hover_button = None
+        """
+        Update hover state for shop buttons
+        Returns True if the hovered button changed, False otherwise
+        """
+        hover_button = self.get_shop_button(mouse_pos)
+        if hover_button == self.hover_button:
+            return False
+            
+        self.hover_button = hover_button
+        self.hover_changed = True
+        return True
         
-        # Check each button
-        for button_id, button_rect in self.buttons.items():
-            if button_rect.collidepoint(mouse_pos):
-                self.hover_button = button_id
-                break
-                
+
     def check_continue_button(self, mouse_pos):
         """Check if continue button was clicked"""
         return self.buttons["continue"].collidepoint(mouse_pos)
@@ -329,21 +487,17 @@ class UI:
         
     def check_upgrade_buttons(self, mouse_pos):
         """Check if any upgrade button was clicked, return the upgrade id or None"""
-        for upgrade_id in ["line_length", "hook_capacity", "round_timer"]:
-            if self.buttons[upgrade_id].collidepoint(mouse_pos):
-                # Check if upgrade is available (not max level and can afford)
-                level = self.game_state.upgrades[upgrade_id]
-                
-                if level >= len(Config.UPGRADE_COSTS[upgrade_id]):
-                    return None  # Max level reached
-                    
-                cost = Config.UPGRADE_COSTS[upgrade_id][level]
-                if self.game_state.get_coins() < cost:
-                    return None  # Can't afford
-                    
-                return upgrade_id
-                
-        return None
+        upgrade_id = self.get_shop_button(mouse_pos)
+        if upgrade_id not in self.game_state.upgrades:
+            return None  # Not over an upgrade button
+            
+        # Check if upgrade is available (not max level and can afford)
+        self.refresh_shop(self.game_state.get_coins())
+        cost_text, can_afford, is_max = self.upgrade_status[upgrade_id]
+        if not can_afford:
+            return None  # Max level reached or can't afford
+            
+        return upgrade_id
         
     def check_reset_button(self, mouse_pos):
         """Check if reset button was clicked"""